@@ -1,13 +1,18 @@
 # Copyright 2023 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+# The tests in this module are independent of each other, and can be split across processes with
+# `pants test --pytest-xdist-enabled src/python/pants/backend/python/util_rules/faas_test.py`.
+
 from __future__ import annotations
 
 from pathlib import Path
 from textwrap import dedent
-from typing import Optional
+from typing import Any, Callable, Optional
 from unittest.mock import Mock
 
 import pytest
+from _pytest.tmpdir import TempPathFactory
 
 from pants.backend.awslambda.python.target_types import rules as target_type_rules
 from pants.backend.python.target_types import (
@@ -38,6 +43,7 @@ from pants.backend.python.util_rules.faas import (
 from pants.backend.python.util_rules.pex import CompletePlatforms, Pex
 from pants.backend.python.util_rules.pex_from_targets import PexFromTargetsRequest
 from pants.backend.python.util_rules.pex_venv import PexVenv, PexVenvLayout, PexVenvRequest
+from pants.base.build_root import BuildRoot
 from pants.build_graph.address import Address
 from pants.core.goals.package import OutputPathField
 from pants.core.target_types import FileTarget
@@ -51,20 +57,100 @@ from pants.testutil.rule_runner import (
     engine_error,
     run_rule_with_mocks,
 )
+from pants.util.dirutil import register_rmtree
 from pants.util.strutil import softwrap
 
+_TARGET_TYPE_RULES = tuple(target_type_rules())
+_PYTHON_TARGET_TYPES_RULES = tuple(python_target_types_rules())
+
+# Top-level directory of the build root that holds sources shared by all tests in this module, and
+# so is not cleared between tests.
+_SHARED_SANDBOXES_DIR = "ics_sandboxes"
+
+_ADDRESS_PATH_TARGET = Address("path", target_name="target")
+_ADDRESS_ADDR = Address("addr")
+_VALIDATION_ADDR = Address("", target_name="t")
+
+_ROOT_BUILD = dedent(
+    """\
+    python_requirement(
+        name='ansicolors',
+        requirements=['ansicolors'],
+        modules=['colors'],
+    )
+    """
+)
+
+_PROJECT_BUILD = dedent(
+    """\
+    python_sources(sources=['app.py'])
+    mock_faas(name='first_party', handler='project.app:func')
+    mock_faas(name='first_party_shorthand', handler='app.py:func')
+    mock_faas(name='third_party', handler='colors:func')
+    mock_faas(name='unrecognized', handler='who_knows.module:func')
+
+    python_sources(name="dep1", sources=["ambiguous.py"])
+    python_sources(name="dep2", sources=["ambiguous.py"])
+    mock_faas(
+        name="ambiguous",
+        handler='ambiguous.py:func',
+    )
+    mock_faas(
+        name="disambiguated",
+        handler='ambiguous.py:func',
+        dependencies=["!./ambiguous.py:dep2"],
+    )
+
+    python_sources(
+        name="ambiguous_in_another_root", sources=["ambiguous_in_another_root.py"]
+    )
+    mock_faas(
+        name="another_root__file_used",
+        handler="ambiguous_in_another_root.py:func",
+    )
+    mock_faas(
+        name="another_root__module_used",
+        handler="project.ambiguous_in_another_root:func",
+    )
+    """
+)
+
+_EXPECTED_AMBIGUOUS_LOG = softwrap(
+    """
+    project:ambiguous has the field `handler='ambiguous.py:func'`, which maps to the Python
+    module `project.ambiguous`
+    """
+)
+
+_EXPECTED_ANOTHER_ROOT_LOG = softwrap(
+    """
+    ['project/ambiguous_in_another_root.py:ambiguous_in_another_root',
+    'src/py/project/ambiguous_in_another_root.py']
+    """
+)
+
+# Stands in for request fields that `build_python_faas` only passes through to mocked rules.
+_INERT_FIELD = object()
+
 
 class MockFaaS(Target):
     alias = "mock_faas"
     core_fields = (PythonFaaSDependencies, PythonFaaSHandlerField, PythonResolveField)
 
 
-@pytest.fixture
-def rule_runner() -> RuleRunner:
+@pytest.fixture(scope="module")
+def _module_rule_runner(tmp_path_factory: TempPathFactory) -> RuleRunner:
+    # Building the scheduler and rule graph dominates the cost of these tests, so do it once per
+    # module and share it, resetting the mutable state between tests in `rule_runner` below.
+    # pytest retains its base temp directories across runs, so the build root is also registered
+    # for removal at exit, as RuleRunner does for the build roots it creates itself.
+    build_root = tmp_path_factory.mktemp("pants_build_root", numbered=True)
+    register_rmtree(str(build_root))
     return RuleRunner(
+        build_root=build_root,
         rules=[
-            *target_type_rules(),
-            *python_target_types_rules(),
+            *_TARGET_TYPE_RULES,
+            *_PYTHON_TARGET_TYPES_RULES,
             QueryRule(ResolvedPythonFaaSHandler, [ResolvePythonFaaSHandlerRequest]),
             QueryRule(InferredDependencies, [InferPythonFaaSHandlerDependency]),
             QueryRule(RuntimePlatforms, [RuntimePlatformsRequest]),
@@ -78,20 +164,51 @@ def rule_runner() -> RuleRunner:
     )
 
 
+@pytest.fixture
+def rule_runner(_module_rule_runner: RuleRunner) -> RuleRunner:
+    # Another RuleRunner may have been created since this one.
+    BuildRoot().path = _module_rule_runner.build_root
+    _module_rule_runner.clear_build_root(keep=[_SHARED_SANDBOXES_DIR])
+    _module_rule_runner.set_options([])
+    return _module_rule_runner
+
+
+@pytest.fixture(scope="module")
+def ics_sandboxes(_module_rule_runner: RuleRunner) -> dict[str, Address]:
+    """Write a `python_sources` target per interpreter constraint once for the whole module."""
+    sandboxes = {"==3.45.*": "star", ">=3.45,<3.46": "range", "==3.33.*": "unknown"}
+    files = {}
+    addresses = {}
+    for ics, name in sandboxes.items():
+        spec_path = f"{_SHARED_SANDBOXES_DIR}/{name}"
+        files[f"{spec_path}/BUILD"] = (
+            f"python_sources(name='target', interpreter_constraints=['{ics}'])"
+        )
+        files[f"{spec_path}/x.py"] = ""
+        addresses[ics] = Address(spec_path, target_name="target")
+    _module_rule_runner.write_files(files)
+    return addresses
+
+
+@pytest.fixture
+def ics_address(request, ics_sandboxes: dict[str, Address]) -> Address:
+    """The address of the `ics_sandboxes` target for the (indirectly parametrized) ICs."""
+    return ics_sandboxes[request.param]
+
+
 @pytest.mark.parametrize("invalid_handler", ("path.to.lambda", "lambda.py"))
 def test_handler_validation(invalid_handler: str) -> None:
     with pytest.raises(InvalidFieldException):
-        PythonFaaSHandlerField(invalid_handler, Address("", target_name="t"))
+        PythonFaaSHandlerField(invalid_handler, _VALIDATION_ADDR)
 
 
 def test_resolve_handler(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files({"src/python/project/lambda.py": "", "src/python/project/f2.py": ""})
+
     def assert_resolved(
         handler: str, *, expected_module: str, expected_func: str, is_file: bool
     ) -> None:
         addr = Address("src/python/project")
-        rule_runner.write_files(
-            {"src/python/project/lambda.py": "", "src/python/project/f2.py": ""}
-        )
         field = PythonFaaSHandlerField(handler, addr)
         result = rule_runner.request(
             ResolvedPythonFaaSHandler, [ResolvePythonFaaSHandlerRequest(field)]
@@ -121,51 +238,11 @@ def test_resolve_handler(rule_runner: RuleRunner) -> None:
 def test_infer_handler_dependency(rule_runner: RuleRunner, caplog) -> None:
     rule_runner.write_files(
         {
-            "BUILD": dedent(
-                """\
-                python_requirement(
-                    name='ansicolors',
-                    requirements=['ansicolors'],
-                    modules=['colors'],
-                )
-                """
-            ),
+            "BUILD": _ROOT_BUILD,
             "project/app.py": "",
             "project/ambiguous.py": "",
             "project/ambiguous_in_another_root.py": "",
-            "project/BUILD": dedent(
-                """\
-                python_sources(sources=['app.py'])
-                mock_faas(name='first_party', handler='project.app:func')
-                mock_faas(name='first_party_shorthand', handler='app.py:func')
-                mock_faas(name='third_party', handler='colors:func')
-                mock_faas(name='unrecognized', handler='who_knows.module:func')
-
-                python_sources(name="dep1", sources=["ambiguous.py"])
-                python_sources(name="dep2", sources=["ambiguous.py"])
-                mock_faas(
-                    name="ambiguous",
-                    handler='ambiguous.py:func',
-                )
-                mock_faas(
-                    name="disambiguated",
-                    handler='ambiguous.py:func',
-                    dependencies=["!./ambiguous.py:dep2"],
-                )
-
-                python_sources(
-                    name="ambiguous_in_another_root", sources=["ambiguous_in_another_root.py"]
-                )
-                mock_faas(
-                    name="another_root__file_used",
-                    handler="ambiguous_in_another_root.py:func",
-                )
-                mock_faas(
-                    name="another_root__module_used",
-                    handler="project.ambiguous_in_another_root:func",
-                )
-                """
-            ),
+            "project/BUILD": _PROJECT_BUILD,
             "src/py/project/ambiguous_in_another_root.py": "",
             "src/py/project/BUILD.py": "python_sources()",
         }
@@ -197,15 +274,7 @@ def test_infer_handler_dependency(rule_runner: RuleRunner, caplog) -> None:
     caplog.clear()
     assert_inferred(Address("project", target_name="ambiguous"), expected=None)
     assert len(caplog.records) == 1
-    assert (
-        softwrap(
-            """
-            project:ambiguous has the field `handler='ambiguous.py:func'`, which maps to the Python
-            module `project.ambiguous`
-            """
-        )
-        in caplog.text
-    )
+    assert _EXPECTED_AMBIGUOUS_LOG in caplog.text
     assert "['project/ambiguous.py:dep1', 'project/ambiguous.py:dep2']" in caplog.text
 
     # Test that ignores can disambiguate an otherwise ambiguous handler. Ensure we don't log a
@@ -231,15 +300,7 @@ def test_infer_handler_dependency(rule_runner: RuleRunner, caplog) -> None:
     caplog.clear()
     assert_inferred(Address("project", target_name="another_root__module_used"), expected=None)
     assert len(caplog.records) == 1
-    assert (
-        softwrap(
-            """
-            ['project/ambiguous_in_another_root.py:ambiguous_in_another_root',
-            'src/py/project/ambiguous_in_another_root.py']
-            """
-        )
-        in caplog.text
-    )
+    assert _EXPECTED_ANOTHER_ROOT_LOG in caplog.text
 
     # Test that we can turn off the inference.
     rule_runner.set_options(["--no-python-infer-entry-points"])
@@ -283,13 +344,11 @@ def test_infer_runtime_platforms_when_known_runtime_and_no_complete_platforms(
     expected_complete_platforms: list[str],
     rule_runner: RuleRunner,
 ) -> None:
-    address = Address("path", target_name="target")
-
     request = RuntimePlatformsRequest(
-        address=address,
+        address=_ADDRESS_PATH_TARGET,
         target_name="unused",
-        runtime=TestRuntimeField(value, address),
-        complete_platforms=PythonFaaSCompletePlatforms(None, address),
+        runtime=TestRuntimeField(value, _ADDRESS_PATH_TARGET),
+        complete_platforms=PythonFaaSCompletePlatforms(None, _ADDRESS_PATH_TARGET),
         architecture=FaaSArchitecture.X86_64,
     )
 
@@ -304,13 +363,11 @@ def test_infer_runtime_platforms_when_known_runtime_and_no_complete_platforms(
 def test_infer_runtime_platforms_errors_when_unknown_runtime_and_no_complete_platforms(
     rule_runner: RuleRunner,
 ) -> None:
-    address = Address("path", target_name="target")
-
     request = RuntimePlatformsRequest(
-        address=address,
+        address=_ADDRESS_PATH_TARGET,
         target_name="unused",
-        runtime=TestRuntimeField("98.76", address),
-        complete_platforms=PythonFaaSCompletePlatforms(None, address),
+        runtime=TestRuntimeField("98.76", _ADDRESS_PATH_TARGET),
+        complete_platforms=PythonFaaSCompletePlatforms(None, _ADDRESS_PATH_TARGET),
         architecture=FaaSArchitecture.X86_64,
     )
 
@@ -325,13 +382,12 @@ def test_infer_runtime_platforms_when_complete_platforms(
     rule_runner: RuleRunner,
 ) -> None:
     rule_runner.write_files({"path/BUILD": "file(name='cp', source='cp.json')", "path/cp.json": ""})
-    address = Address("path", target_name="target")
     request = RuntimePlatformsRequest(
-        address=address,
+        address=_ADDRESS_PATH_TARGET,
         target_name="unused",
-        runtime=TestRuntimeField("completely ignored!", address),
+        runtime=TestRuntimeField("completely ignored!", _ADDRESS_PATH_TARGET),
         architecture=FaaSArchitecture.ARM64,  # ignored
-        complete_platforms=PythonFaaSCompletePlatforms(["path:cp"], address),
+        complete_platforms=PythonFaaSCompletePlatforms(["path:cp"], _ADDRESS_PATH_TARGET),
     )
 
     platforms = rule_runner.request(RuntimePlatforms, [request])
@@ -340,7 +396,7 @@ def test_infer_runtime_platforms_when_complete_platforms(
 
 
 @pytest.mark.parametrize(
-    ("ics", "expected_interpreter_version", "expected_complete_platforms"),
+    ("ics_address", "expected_interpreter_version", "expected_complete_platforms"),
     [
         pytest.param(
             "==3.45.*",
@@ -352,26 +408,19 @@ def test_infer_runtime_platforms_when_complete_platforms(
             ">=3.45,<3.46", (3, 45), ["complete_platform_faas-test-3-45.json"], id="range"
         ),
     ],
+    indirect=["ics_address"],
 )
 def test_infer_runtime_platforms_when_known_narrow_ics_only(
-    ics: str,
+    ics_address: Address,
     expected_interpreter_version: tuple[int, int],
     expected_complete_platforms: list[str],
     rule_runner: RuleRunner,
 ) -> None:
-    rule_runner.write_files(
-        {
-            "path/BUILD": f"python_sources(name='target', interpreter_constraints=['{ics}'])",
-            "path/x.py": "",
-        }
-    )
-
-    address = Address("path", target_name="target")
     request = RuntimePlatformsRequest(
-        address=address,
+        address=ics_address,
         target_name="example_target",
-        runtime=TestRuntimeField(None, address),
-        complete_platforms=PythonFaaSCompletePlatforms(None, address),
+        runtime=TestRuntimeField(None, ics_address),
+        complete_platforms=PythonFaaSCompletePlatforms(None, ics_address),
         architecture=FaaSArchitecture.X86_64,
     )
 
@@ -383,22 +432,16 @@ def test_infer_runtime_platforms_when_known_narrow_ics_only(
     )
 
 
+@pytest.mark.parametrize("ics_address", ["==3.33.*"], indirect=True)
 def test_infer_runtime_platforms_errors_when_unknown_narrow_ics(
+    ics_address: Address,
     rule_runner: RuleRunner,
 ) -> None:
-    rule_runner.write_files(
-        {
-            "path/BUILD": "python_sources(name='target', interpreter_constraints=['==3.33.*'])",
-            "path/x.py": "",
-        }
-    )
-
-    address = Address("path", target_name="target")
     request = RuntimePlatformsRequest(
-        address=address,
+        address=ics_address,
         target_name="example_target",
-        runtime=TestRuntimeField(None, address),
-        complete_platforms=PythonFaaSCompletePlatforms(None, address),
+        runtime=TestRuntimeField(None, ics_address),
+        complete_platforms=PythonFaaSCompletePlatforms(None, ics_address),
         architecture=FaaSArchitecture.X86_64,
     )
 
@@ -430,13 +473,12 @@ def test_infer_runtime_platforms_errors_when_wide_ics(
         }
     )
 
-    address = Address("path", target_name="target")
     request = RuntimePlatformsRequest(
-        address=address,
+        address=_ADDRESS_PATH_TARGET,
         target_name="example_target",
-        runtime=TestRuntimeField(None, address),
+        runtime=TestRuntimeField(None, _ADDRESS_PATH_TARGET),
         architecture=FaaSArchitecture.X86_64,
-        complete_platforms=PythonFaaSCompletePlatforms(None, address),
+        complete_platforms=PythonFaaSCompletePlatforms(None, _ADDRESS_PATH_TARGET),
     )
 
     with pytest.raises(ExecutionError) as exc:
@@ -448,29 +490,64 @@ def test_infer_runtime_platforms_errors_when_wide_ics(
     assert ics in str(exc.value)
 
 
-def test_venv_create_extra_args_are_passed_through() -> None:
-    # Setup
-    addr = Address("addr")
-    extra_args = (
-        "--extra-args-for-test",
-        "distinctive-value-FA943D37-51DA-445A-8F00-7E9C7DA8FAAA",
-    )
-    extra_args_field = PythonFaaSPex3VenvCreateExtraArgsField(extra_args, addr)
-    request = BuildPythonFaaSRequest(
-        address=addr,
+def _default_build_faas_mocks(
+    *,
+    pex_mock: Callable[[PexFromTargetsRequest], Pex] | None = None,
+    pex_venv_mock: Callable[[PexVenvRequest], PexVenv] | None = None,
+) -> list[MockGet]:
+    return [
+        MockGet(
+            output_type=RuntimePlatforms,
+            input_types=(RuntimePlatformsRequest,),
+            mock=lambda _: RuntimePlatforms(interpreter_version=None),
+        ),
+        MockGet(
+            output_type=ResolvedPythonFaaSHandler,
+            input_types=(ResolvePythonFaaSHandlerRequest,),
+            mock=lambda _: Mock(),
+        ),
+        MockGet(output_type=Digest, input_types=(CreateDigest,), mock=lambda _: EMPTY_DIGEST),
+        MockGet(
+            output_type=Pex,
+            input_types=(PexFromTargetsRequest,),
+            mock=pex_mock or (lambda _: Pex(digest=EMPTY_DIGEST, name="pex", python=None)),
+        ),
+        MockGet(output_type=PexVenv, input_types=(PexVenvRequest,), mock=pex_venv_mock or Mock()),
+    ]
+
+
+def _make_build_request(
+    address: Address = _ADDRESS_ADDR, **overrides: Any
+) -> BuildPythonFaaSRequest:
+    defaults: dict[str, Any] = dict(
+        address=address,
         target_name="x",
-        complete_platforms=Mock(),
+        complete_platforms=_INERT_FIELD,
         handler=None,
-        output_path=OutputPathField(None, addr),
-        runtime=Mock(),
+        output_path=OutputPathField(None, address),
+        runtime=_INERT_FIELD,
         architecture=FaaSArchitecture.X86_64,
-        pex3_venv_create_extra_args=extra_args_field,
-        pex_build_extra_args=PythonFaaSPexBuildExtraArgs(None, addr),
-        layout=PythonFaaSLayoutField(PexVenvLayout.FLAT_ZIPPED.value, addr),
+        pex3_venv_create_extra_args=Mock(),
+        pex_build_extra_args=PythonFaaSPexBuildExtraArgs(None, address),
+        layout=PythonFaaSLayoutField(PexVenvLayout.FLAT_ZIPPED.value, address),
         include_requirements=False,
         include_sources=False,
         reexported_handler_module=None,
     )
+    return BuildPythonFaaSRequest(**{**defaults, **overrides})
+
+
+def test_venv_create_extra_args_are_passed_through() -> None:
+    # Setup
+    extra_args = (
+        "--extra-args-for-test",
+        "distinctive-value-FA943D37-51DA-445A-8F00-7E9C7DA8FAAA",
+    )
+    request = _make_build_request(
+        pex3_venv_create_extra_args=PythonFaaSPex3VenvCreateExtraArgsField(
+            extra_args, _ADDRESS_ADDR
+        )
+    )
 
     observed_extra_args = []
 
@@ -483,25 +560,7 @@ def test_venv_create_extra_args_are_passed_through() -> None:
     run_rule_with_mocks(
         build_python_faas,
         rule_args=[request],
-        mock_gets=[
-            MockGet(
-                output_type=RuntimePlatforms,
-                input_types=(RuntimePlatformsRequest,),
-                mock=lambda _: RuntimePlatforms(interpreter_version=None),
-            ),
-            MockGet(
-                output_type=ResolvedPythonFaaSHandler,
-                input_types=(ResolvePythonFaaSHandlerRequest,),
-                mock=lambda _: Mock(),
-            ),
-            MockGet(output_type=Digest, input_types=(CreateDigest,), mock=lambda _: EMPTY_DIGEST),
-            MockGet(
-                output_type=Pex,
-                input_types=(PexFromTargetsRequest,),
-                mock=lambda _: Pex(digest=EMPTY_DIGEST, name="pex", python=None),
-            ),
-            MockGet(output_type=PexVenv, input_types=(PexVenvRequest,), mock=mock_get_pex_venv),
-        ],
+        mock_gets=_default_build_faas_mocks(pex_venv_mock=mock_get_pex_venv),
     )
 
     # Verify
@@ -519,22 +578,7 @@ def test_venv_create_extra_args_are_passed_through() -> None:
 )
 def test_layout_should_be_passed_through_and_adjust_filename(input_layout, expected_output) -> None:
     # Setup
-    addr = Address("x")
-    request = BuildPythonFaaSRequest(
-        address=addr,
-        target_name="x",
-        complete_platforms=Mock(),
-        handler=None,
-        output_path=OutputPathField(None, addr),
-        runtime=Mock(),
-        architecture=FaaSArchitecture.X86_64,
-        pex3_venv_create_extra_args=Mock(),
-        pex_build_extra_args=PythonFaaSPexBuildExtraArgs(None, addr),
-        layout=input_layout,
-        include_requirements=False,
-        include_sources=False,
-        reexported_handler_module=None,
-    )
+    request = _make_build_request(Address("x"), layout=input_layout)
 
     mock_build = Mock()
 
@@ -542,25 +586,7 @@ def test_layout_should_be_passed_through_and_adjust_filename(input_layout, expec
     run_rule_with_mocks(
         build_python_faas,
         rule_args=[request],
-        mock_gets=[
-            MockGet(
-                output_type=RuntimePlatforms,
-                input_types=(RuntimePlatformsRequest,),
-                mock=lambda _: RuntimePlatforms(interpreter_version=None),
-            ),
-            MockGet(
-                output_type=ResolvedPythonFaaSHandler,
-                input_types=(ResolvePythonFaaSHandlerRequest,),
-                mock=lambda _: Mock(),
-            ),
-            MockGet(output_type=Digest, input_types=(CreateDigest,), mock=lambda _: EMPTY_DIGEST),
-            MockGet(
-                output_type=Pex,
-                input_types=(PexFromTargetsRequest,),
-                mock=lambda _: Pex(digest=EMPTY_DIGEST, name="pex", python=None),
-            ),
-            MockGet(output_type=PexVenv, input_types=(PexVenvRequest,), mock=mock_build),
-        ],
+        mock_gets=_default_build_faas_mocks(pex_venv_mock=mock_build),
     )
 
     args = mock_build.mock_calls[0].args[0]
@@ -569,25 +595,10 @@ def test_layout_should_be_passed_through_and_adjust_filename(input_layout, expec
 
 
 def test_pex_build_extra_args_passed_through() -> None:
-    addr = Address("addr")
     extra_args = ("--exclude=test_package",)
-
-    extra_pex_args_field = PythonFaaSPexBuildExtraArgs(extra_args, addr)
-
-    request = BuildPythonFaaSRequest(
-        address=addr,
+    request = _make_build_request(
         target_name="test",
-        complete_platforms=Mock(),
-        handler=None,
-        output_path=OutputPathField(None, addr),
-        runtime=Mock(),
-        architecture=FaaSArchitecture.X86_64,
-        pex3_venv_create_extra_args=Mock(),
-        pex_build_extra_args=extra_pex_args_field,
-        layout=PythonFaaSLayoutField(PexVenvLayout.FLAT_ZIPPED.value, addr),
-        include_requirements=False,
-        include_sources=False,
-        reexported_handler_module=None,
+        pex_build_extra_args=PythonFaaSPexBuildExtraArgs(extra_args, _ADDRESS_ADDR),
     )
 
     mock_build = Mock()
@@ -596,25 +607,7 @@ def test_pex_build_extra_args_passed_through() -> None:
     run_rule_with_mocks(
         build_python_faas,
         rule_args=[request],
-        mock_gets=[
-            MockGet(
-                output_type=RuntimePlatforms,
-                input_types=(RuntimePlatformsRequest,),
-                mock=lambda _: RuntimePlatforms(interpreter_version=None),
-            ),
-            MockGet(
-                output_type=ResolvedPythonFaaSHandler,
-                input_types=(ResolvePythonFaaSHandlerRequest,),
-                mock=lambda _: Mock(),
-            ),
-            MockGet(output_type=Digest, input_types=(CreateDigest,), mock=lambda _: EMPTY_DIGEST),
-            MockGet(
-                output_type=Pex,
-                input_types=(PexFromTargetsRequest,),
-                mock=mock_build,
-            ),
-            MockGet(output_type=PexVenv, input_types=(PexVenvRequest,), mock=Mock()),
-        ],
+        mock_gets=_default_build_faas_mocks(pex_mock=mock_build),
     )
 
     assert extra_args[0] in mock_build.mock_calls[0].args[0].additional_args
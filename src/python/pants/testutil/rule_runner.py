@@ -69,7 +69,13 @@ from pants.source import source_root
 from pants.testutil.option_util import create_options_bootstrapper
 from pants.util.collections import assert_single_element
 from pants.util.contextutil import pushd, temporary_dir, temporary_file
-from pants.util.dirutil import recursive_dirname, safe_mkdir, safe_mkdtemp, safe_open
+from pants.util.dirutil import (
+    recursive_dirname,
+    safe_mkdir,
+    safe_mkdtemp,
+    safe_open,
+    safe_rmtree,
+)
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import OrderedSet
 from pants.util.strutil import softwrap
@@ -265,9 +271,13 @@ class RuleRunner:
         inherent_environment: EnvironmentName | None = EnvironmentName(None),
         is_bootstrap: bool = False,
         auxiliary_goals: Iterable[type[AuxiliaryGoal]] | None = None,
+        build_root: str | PurePath | None = None,
     ) -> None:
         bootstrap_args = [*bootstrap_args]
 
+        if preserve_tmpdirs and build_root is not None:
+            raise ValueError("`preserve_tmpdirs` and `build_root` cannot be used together.")
+
         root_dir: Path | None = None
         if preserve_tmpdirs:
             root_dir = Path(mkdtemp(prefix="RuleRunner."))
@@ -275,9 +285,12 @@ class RuleRunner:
             bootstrap_args.extend(
                 ["--keep-sandboxes=always", f"--local-execution-root-dir={root_dir}"]
             )
-            build_root = (root_dir / "BUILD_ROOT").resolve()
-            build_root.mkdir()
-            self.build_root = str(build_root)
+            preserved_build_root = (root_dir / "BUILD_ROOT").resolve()
+            preserved_build_root.mkdir()
+            self.build_root = str(preserved_build_root)
+        elif build_root is not None:
+            # An existing directory provided by the caller, e.g. one managed by pytest's `tmp_path`.
+            self.build_root = os.path.realpath(build_root)
         else:
             self.build_root = os.path.realpath(safe_mkdtemp(prefix="_BUILD_ROOT"))
 
@@ -566,6 +579,27 @@ class RuleRunner:
             )
         return tuple(paths)
 
+    def clear_build_root(self, *, keep: Iterable[str] = ()) -> None:
+        """Remove everything written to the build root, so the RuleRunner can be reused.
+
+        :API: public
+
+        keep: Names of top-level entries of the build root to leave in place.
+        """
+        build_root = Path(self.build_root)
+        removed = []
+        for child in build_root.iterdir():
+            if child.name in ("BUILDROOT", ".pants.d", *keep):
+                continue
+            if child.is_dir() and not child.is_symlink():
+                removed.extend(str(p.relative_to(build_root)) for p in child.rglob("*"))
+                safe_rmtree(child)
+            else:
+                child.unlink()
+            removed.append(child.name)
+        if removed:
+            self._invalidate_for(*removed)
+
     def read_file(self, file: str | PurePath, mode: str = "r") -> str | bytes:
         """Read a file that was written to the build root, useful for testing."""
         path = os.path.join(self.build_root, file)
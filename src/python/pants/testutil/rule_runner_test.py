@@ -0,0 +1,51 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pants.base.build_root import BuildRoot
+from pants.build_graph.address import Address, ResolveError
+from pants.engine.target import Target
+from pants.testutil.rule_runner import RuleRunner, engine_error
+
+
+def test_build_root(tmp_path: Path) -> None:
+    rule_runner = RuleRunner(build_root=tmp_path)
+    assert rule_runner.build_root == os.path.realpath(tmp_path)
+    assert BuildRoot().path == rule_runner.build_root
+    assert (tmp_path / "BUILDROOT").is_file()
+
+    rule_runner.write_files({"f.txt": "hello"})
+    assert (tmp_path / "f.txt").read_text() == "hello"
+
+
+def test_build_root_conflicts_with_preserve_tmpdirs(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="cannot be used together"):
+        RuleRunner(build_root=tmp_path, preserve_tmpdirs=True)
+
+
+class MockTarget(Target):
+    alias = "mock_tgt"
+    core_fields = ()
+
+
+def test_clear_build_root() -> None:
+    rule_runner = RuleRunner(target_types=[MockTarget])
+    rule_runner.write_files(
+        {"a/BUILD": "mock_tgt(name='t')", "b/BUILD": "mock_tgt(name='t')", "h.txt": ""}
+    )
+    assert rule_runner.get_target(Address("a", target_name="t"))
+
+    rule_runner.clear_build_root(keep=["b"])
+
+    build_root = Path(rule_runner.build_root)
+    assert sorted(p.name for p in build_root.iterdir()) == [".pants.d", "BUILDROOT", "b"]
+    # The engine must not serve the removed target from its memoized state.
+    with engine_error(ResolveError):
+        rule_runner.get_target(Address("a", target_name="t"))
+    assert rule_runner.get_target(Address("b", target_name="t"))